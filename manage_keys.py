@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import argparse
 import os
 import subprocess
 import sys
@@ -7,6 +8,8 @@ import re
 import json
 from datetime import datetime
 import shutil
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
 
 # Check for dependencies
 GIT_AVAILABLE = False
@@ -16,16 +19,34 @@ try:
 except (subprocess.CalledProcessError, FileNotFoundError):
     print("Warning: Git is not installed. Some features will be limited.")
 
-# Suppress Tk deprecation warning on macOS
-os.environ['TK_SILENCE_DEPRECATION'] = '1'
-
-CLIPBOARD_AVAILABLE = False
+# orjson is optional; fall back to the standard library json module
 try:
-    import tkinter as tk
-    from tkinter import messagebox
-    CLIPBOARD_AVAILABLE = True
+    import orjson
+
+    def json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    print("Warning: tkinter is not installed. Clipboard functionality will be limited.")
+    # Built once; matches orjson's 2-space indented UTF-8 output
+    JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def json_loads(data: bytes):
+        return json.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        return JSON_ENCODER.encode(obj).encode('utf-8')
+
+# Matches SSH (git@github.com:owner/repo) and HTTPS GitHub remote URLs
+GITHUB_URL_RE = re.compile(r'^(?:git@github\.com:|https://github\.com/)([^/]+/[^/]+?)(?:\.git)?/?$')
+
+# Native clipboard tools, tried before falling back to tkinter
+CLIPBOARD_COMMANDS = {
+    'darwin': ["pbcopy"],
+    'linux': ["xclip", "-selection", "clipboard"],
+    'win32': ["clip"],
+}
 
 class SSHKeyManager:
     def __init__(self):
@@ -33,6 +54,13 @@ class SSHKeyManager:
         self.aliases_file = "key_aliases.json"
         self.backup_dir = ".key_backups"
         self.aliases: Dict[str, dict] = {}
+        self.keys: List[str] = []
+        self.keys_on_disk: tuple = ()
+        self.key_names: List[str] = []
+        self.key_parts: List[tuple] = []
+        self.key_index: Dict[tuple, int] = {}
+        self.repo_is_public: Optional[bool] = None
+        self.repo = None  # GitPython Repo, loaded on first sync; False if GitPython is missing
         self.load_keys()
         self.load_aliases()
         
@@ -50,15 +78,25 @@ class SSHKeyManager:
         """Load aliases and metadata from JSON file."""
         if os.path.exists(self.aliases_file):
             try:
-                with open(self.aliases_file, 'r') as f:
-                    self.aliases = json.load(f)
+                with open(self.aliases_file, 'rb') as f:
+                    self.aliases = json_loads(f.read())
             except json.JSONDecodeError:
                 print("Warning: Could not load aliases file")
 
     def save_aliases(self) -> None:
         """Save aliases and metadata to JSON file."""
-        with open(self.aliases_file, 'w') as f:
-            json.dump(self.aliases, f, indent=2)
+        self.replace_file(self.aliases_file, json_dumps(self.aliases))
+
+    def replace_file(self, path: str, data) -> None:
+        """Write data to a temporary file and move it over path in one step.
+        A symlinked path keeps its link (the target is replaced) and the existing file mode is kept."""
+        target = os.path.realpath(path)
+        tmp_file = target + '.tmp'
+        with open(tmp_file, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_file)
+        os.replace(tmp_file, target)
 
     def create_backup(self) -> None:
         """Create a backup of the keys file."""
@@ -67,33 +105,109 @@ class SSHKeyManager:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join(self.backup_dir, f"authorized_keys_{timestamp}")
-        shutil.copy2(self.keys_file, backup_file)
+        try:
+            # save_keys replaces the file rather than rewriting it, so a hard link keeps the old contents
+            os.link(os.path.realpath(self.keys_file), backup_file)
+        except OSError:
+            shutil.copy2(self.keys_file, backup_file)
         print(f"Backup created: {backup_file}")
 
     def load_keys(self) -> None:
         """Load existing keys."""
         if not os.path.exists(self.keys_file):
             self.keys = []
+            self.keys_on_disk = ()
+            self.index_keys()
             return
         
         with open(self.keys_file, 'r') as f:
-            self.keys = [line.strip() for line in f if line.strip()]
+            lines = f.read().splitlines()
+        self.keys = [line.strip() for line in lines if line.strip()]
+        self.keys_on_disk = tuple(self.keys)
+        self.index_keys()
+
+    def index_keys(self) -> None:
+        """Rebuild the per-key name and (type, data) lists, splitting each key once."""
+        self.key_names = []
+        self.key_parts = []
+        for key in self.keys:
+            name, parts = self.split_key(key)
+            self.key_names.append(name)
+            self.key_parts.append(parts)
+        self.rebuild_key_index()
+
+    def rebuild_key_index(self) -> None:
+        """Map each (type, data) pair to the index of its first occurrence in self.keys."""
+        self.key_index = {}
+        for idx, parts in enumerate(self.key_parts):
+            self.key_index.setdefault(parts, idx)
+
+    def remove_keys(self, drop: set) -> None:
+        """Remove the keys at the given indices, rebuilding each list in a single pass."""
+        keep = [i for i in range(len(self.keys)) if i not in drop]
+        self.keys = [self.keys[i] for i in keep]
+        self.key_names = [self.key_names[i] for i in keep]
+        self.key_parts = [self.key_parts[i] for i in keep]
+        self.rebuild_key_index()
 
     def save_keys(self) -> None:
         """Save keys to the authorized_keys file."""
-        self.create_backup()
-        with open(self.keys_file, 'w') as f:
-            f.write('\n'.join(self.keys) + '\n')
+        new_keys = tuple(self.keys)
+        if new_keys == self.keys_on_disk:
+            # Keys match the file on disk; only the aliases may have changed
+            self.save_aliases()
+            return
+
+        if os.path.exists(self.keys_file):
+            self.create_backup()
+        self.replace_file(self.keys_file, '\n'.join(self.keys) + '\n')
+        self.keys_on_disk = new_keys
         self.save_aliases()
 
     def copy_to_clipboard(self, key: str) -> None:
-        """Copy key to clipboard using tkinter."""
-        if not CLIPBOARD_AVAILABLE:
-            print("Clipboard functionality not available (tkinter not installed)")
+        """Copy key to clipboard using pyperclip, the platform clipboard tool, or tkinter."""
+        try:
+            import pyperclip
+        except ImportError:
+            pyperclip = None
+
+        if pyperclip is not None:
+            try:
+                pyperclip.copy(key)
+                print("Key copied to clipboard!")
+                return
+            except pyperclip.PyperclipException:
+                pass
+
+        command = CLIPBOARD_COMMANDS.get(sys.platform)
+        if command:
+            try:
+                # xclip leaves a child owning the selection; captured pipes would block until it exits
+                subprocess.run(command, input=key.encode(), check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                print("Key copied to clipboard!")
+                return
+            except (OSError, subprocess.CalledProcessError):
+                pass
+
+        # tkinter is only imported here so startup doesn't pay for it
+        # Suppress Tk deprecation warning on macOS
+        os.environ['TK_SILENCE_DEPRECATION'] = '1'
+        try:
+            import tkinter as tk
+        except ImportError:
+            print("Clipboard functionality not available (no clipboard tool or tkinter found)")
+            print("Key:", key)
+            return
+
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            # No display available, e.g. over SSH
+            print("Clipboard functionality not available (no clipboard tool or display found)")
             print("Key:", key)
             return
 
-        root = tk.Tk()
         root.withdraw()
         root.clipboard_clear()
         root.clipboard_append(key)
@@ -109,15 +223,14 @@ class SSHKeyManager:
 
         print("\nAvailable SSH Keys:")
         print("-" * 60)
-        
-        for i, key in enumerate(self.keys, 1):
-            name = self.get_key_name(key)
-            if search and search.lower() not in name.lower() and search.lower() not in self.aliases.get(name, {}).get('alias', '').lower():
-                continue
-                
-            key_type = key.split()[0]
+
+        pattern = re.compile(re.escape(search), re.IGNORECASE) if search else None
+        for i, (name, (key_type, _)) in enumerate(zip(self.key_names, self.key_parts), 1):
             alias_info = self.aliases.get(name, {})
             alias = alias_info.get('alias', '')
+            if pattern and not (pattern.search(name) or pattern.search(alias)):
+                continue
+
             expiry = alias_info.get('expiry', '')
             
             print(f"{i}. {name}")
@@ -135,7 +248,7 @@ class SSHKeyManager:
             print("Invalid key index")
             return
 
-        name = self.get_key_name(self.keys[key_idx])
+        name = self.key_names[key_idx]
         if name not in self.aliases:
             self.aliases[name] = {}
         
@@ -152,28 +265,34 @@ class SSHKeyManager:
         if not os.path.exists(ssh_dir):
             return keys
 
-        for file in os.listdir(ssh_dir):
-            if file.endswith(".pub"):
-                try:
-                    with open(os.path.join(ssh_dir, file), 'r') as f:
-                        key = f.read().strip()
-                        if key:
-                            keys.append(key)
-                except:
-                    continue
+        with os.scandir(ssh_dir) as entries:
+            pub_paths = [entry.path for entry in entries if entry.is_file() and entry.name.endswith(".pub")]
+
+        for path in pub_paths:
+            try:
+                with open(path, 'r') as f:
+                    key = f.read().strip()
+                    if key:
+                        keys.append(key)
+            except:
+                continue
         return keys
 
+    def split_key(self, key: str) -> tuple:
+        """Split an SSH key once into its name and its (type, data) pair."""
+        # split(None, 2) stops after the key data; rsplit only scans the comment from the end
+        parts = key.split(None, 2)
+        name = parts[2].rsplit(None, 1)[-1] if len(parts) > 2 else "Unknown"
+        key_parts = (parts[0], parts[1]) if len(parts) >= 2 else (None, None)  # type and key data
+        return name, key_parts
+
     def get_key_name(self, key: str) -> str:
         """Extract name/comment from SSH key."""
-        parts = key.strip().split()
-        return parts[-1] if len(parts) > 2 else "Unknown"
+        return self.split_key(key)[0]
 
     def get_key_parts(self, key: str) -> tuple:
         """Extract the key type and key data from an SSH key, ignoring comments."""
-        parts = key.strip().split()
-        if len(parts) >= 2:
-            return (parts[0], parts[1])  # type and key data
-        return (None, None)
+        return self.split_key(key)[1]
 
     def find_existing_key(self, new_key: str) -> Optional[int]:
         """Find index of existing key with same type and data, ignoring comments."""
@@ -181,11 +300,25 @@ class SSHKeyManager:
         if not new_type or not new_data:
             return None
         
-        for idx, existing_key in enumerate(self.keys):
-            existing_type, existing_data = self.get_key_parts(existing_key)
-            if existing_type == new_type and existing_data == new_data:
-                return idx
-        return None
+        return self.key_index.get((new_type, new_data))
+
+    def parse_selection(self, selection: str, count: int) -> Optional[List[int]]:
+        """Parse a comma-separated list of 1-based numbers or 'all' into 0-based indices.
+        Returns None after printing an error if any entry is invalid or out of range."""
+        if selection.lower() == 'all':
+            return list(range(count))
+
+        try:
+            indices = [int(i) - 1 for i in selection.split(',')]
+        except ValueError:
+            print("Invalid selection")
+            return None
+
+        out_of_range = [str(idx + 1) for idx in indices if not 0 <= idx < count]
+        if out_of_range:
+            print(f"Invalid selection: {', '.join(out_of_range)} out of range")
+            return None
+        return list(dict.fromkeys(indices))  # drop repeats, keep order
 
     def sync_with_git(self, message: str) -> None:
         """Sync changes with git repository."""
@@ -194,11 +327,61 @@ class SSHKeyManager:
             print("Please install git to use this feature.")
             return
             
+        # GitPython is optional and only imported here so startup doesn't pay for it
+        if self.repo is None:
+            try:
+                import git
+            except ImportError:
+                self.repo = False
+            else:
+                try:
+                    self.repo = git.Repo('.')
+                except git.exc.GitError as e:
+                    print(f"Error syncing with git: {e}")
+                    return
+                # GitPython's commit ignores commit.gpgsign, so let git sign via the CLI path
+                if self.repo.config_reader().get_value('commit', 'gpgsign', False):
+                    self.repo = False
+
+        if self.repo:
+            from git.exc import GitError
+            try:
+                self.repo.index.add([self.keys_file])
+                # A freshly cloned empty repo has no HEAD to diff against yet
+                if not self.repo.head.is_valid() or self.repo.index.diff("HEAD"):
+                    self.repo.index.commit(message)
+                else:
+                    print("No changes to commit")
+                self.repo.remotes.origin.pull(rebase=True)
+                # push() reports rejections on the returned infos instead of raising
+                failed = [info for info in self.repo.remotes.origin.push() if info.flags & info.ERROR]
+                if failed:
+                    print(f"Error syncing with git: push failed: {failed[0].summary.strip()}")
+                    return
+                print("Successfully synced with git repository")
+            except (GitError, AttributeError) as e:
+                print(f"Error syncing with git: {e}")
+            return
+
         try:
-            subprocess.run(["git", "add", self.keys_file], check=True)
-            subprocess.run(["git", "commit", "-m", message], check=True)
-            subprocess.run(["git", "pull", "--rebase"], check=True)
-            subprocess.run(["git", "push"], check=True)
+            if os.name == 'posix':
+                # Run all steps in one shell so git is only forked from here once
+                subprocess.run(
+                    ["sh", "-c",
+                     'git add -- "$1" && '
+                     '{ git diff --cached --quiet && echo "No changes to commit" || git commit -m "$2"; } && '
+                     'git pull --rebase && git push',
+                     "sh", self.keys_file, message],
+                    check=True
+                )
+            else:
+                subprocess.run(["git", "add", self.keys_file], check=True)
+                if subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode == 0:
+                    print("No changes to commit")
+                else:
+                    subprocess.run(["git", "commit", "-m", message], check=True)
+                subprocess.run(["git", "pull", "--rebase"], check=True)
+                subprocess.run(["git", "push"], check=True)
             print("Successfully synced with git repository")
         except subprocess.CalledProcessError as e:
             print(f"Error syncing with git: {e}")
@@ -218,57 +401,111 @@ class SSHKeyManager:
         if not selection:
             return
 
-        added_keys = []
-        if selection.lower() == 'all':
-            indices = range(len(system_keys))
-        else:
-            try:
-                indices = [int(i.strip()) - 1 for i in selection.split(',')]
-            except ValueError:
-                print("Invalid selection")
-                return
+        indices = self.parse_selection(selection, len(system_keys))
+        if indices is None:
+            return
 
+        added_keys = []
+        replaced = set()
+        added_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         for idx in indices:
-            if 0 <= idx < len(system_keys):
-                key = system_keys[idx]
-                existing_idx = self.find_existing_key(key)
-                
-                if existing_idx is not None:
-                    existing_name = self.get_key_name(self.keys[existing_idx])
-                    new_name = self.get_key_name(key)
-                    print(f"\nKey {new_name} already exists as {existing_name}")
-                    overwrite = input("Would you like to overwrite it? (y/N): ").lower()
-                    
-                    if overwrite != 'y':
-                        print("Skipping key...")
-                        continue
-                    
-                    # Remove the old key and its alias
-                    old_name = self.get_key_name(self.keys[existing_idx])
-                    self.aliases.pop(old_name, None)
-                    del self.keys[existing_idx]
-                
-                name = self.get_key_name(key)
-                alias = input(f"Enter alias for {name} (press Enter to skip): ").strip()
-                expiry = input("Enter expiry date (YYYY-MM-DD) or press Enter to skip: ").strip()
+            key = system_keys[idx]
+            existing_idx = self.find_existing_key(key)
+            
+            if existing_idx is not None:
+                existing_name = self.key_names[existing_idx]
+                new_name = self.get_key_name(key)
+                print(f"\nKey {new_name} already exists as {existing_name}")
+                overwrite = input("Would you like to overwrite it? (y/N): ").lower()
                 
-                metadata = {
-                    'added': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                if alias:
-                    metadata['alias'] = alias
-                if expiry:
-                    metadata['expiry'] = expiry
+                if overwrite != 'y':
+                    print("Skipping key...")
+                    continue
                 
-                self.aliases[name] = metadata
-                self.keys.append(key)
-                added_keys.append(name)
+                # Remove the old alias now; the old key is dropped once all keys are added
+                old_name = self.key_names[existing_idx]
+                self.aliases.pop(old_name, None)
+                replaced.add(existing_idx)
+            
+            name = self.get_key_name(key)
+            details = input(f"Enter 'alias|YYYY-MM-DD' for {name} (either part optional, press Enter to skip): ")
+            alias, _, expiry = details.partition('|')
+            self.add_key(key, name, alias.strip(), expiry.strip(), added_timestamp)
+            added_keys.append(name)
+
+        if replaced:
+            self.remove_keys(replaced)
 
         if added_keys:
             self.save_keys()
             if input("Would you like to sync changes? (y/N): ").lower() == 'y':
                 self.sync_with_git(f"Added keys: {', '.join(added_keys)}")
 
+    def capture_batch(self, batch_file: str) -> None:
+        """Capture system keys listed in a JSON batch file without prompting.
+        The file holds a list of {"name": ..., "alias": ..., "expiry": ...} objects,
+        where name matches the key comment; alias and expiry are optional."""
+        try:
+            with open(batch_file, 'rb') as f:
+                entries = json_loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"Error reading batch file: {e}")
+            return
+
+        def valid_entry(entry) -> bool:
+            return (isinstance(entry, dict) and isinstance(entry.get('name'), str)
+                    and all(isinstance(entry.get(field, ''), str) for field in ('alias', 'expiry')))
+
+        if not isinstance(entries, list) or not all(valid_entry(e) for e in entries):
+            print("Error: batch file must contain a list of objects with a string 'name' "
+                  "and optional string 'alias' and 'expiry' fields")
+            return
+
+        wanted = {entry['name']: entry for entry in entries}
+        added_keys = []
+        replaced = set()
+        added_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for key in self.get_system_keys():
+            name = self.get_key_name(key)
+            entry = wanted.pop(name, None)
+            if entry is None:
+                continue
+
+            existing_idx = self.find_existing_key(key)
+            if existing_idx is not None:
+                print(f"Overwriting existing key {self.key_names[existing_idx]} with {name}")
+                self.aliases.pop(self.key_names[existing_idx], None)
+                replaced.add(existing_idx)
+
+            self.add_key(key, name, entry.get('alias', ''), entry.get('expiry', ''), added_timestamp)
+            added_keys.append(name)
+
+        if replaced:
+            self.remove_keys(replaced)
+
+        for name in wanted:
+            print(f"Warning: no system key named {name}")
+
+        if added_keys:
+            self.save_keys()
+            print(f"Added keys: {', '.join(added_keys)}")
+
+    def add_key(self, key: str, name: str, alias: str, expiry: str, added_timestamp: str) -> None:
+        """Append a key and record its metadata, keeping the key lists and index in step."""
+        metadata = {
+            'added': added_timestamp
+        }
+        if alias:
+            metadata['alias'] = alias
+        if expiry:
+            metadata['expiry'] = expiry
+
+        self.aliases[name] = metadata
+        self.keys.append(key)
+        self.key_names.append(name)
+        self.key_parts.append(self.get_key_parts(key))
+        self.key_index[self.key_parts[-1]] = len(self.keys) - 1
+
     def deploy_keys(self) -> None:
         """Deploy selected keys to the current system."""
         if not self.keys:
@@ -276,8 +513,7 @@ class SSHKeyManager:
             return
 
         print("\nAvailable keys:")
-        for i, key in enumerate(self.keys, 1):
-            name = self.get_key_name(key)
+        for i, name in enumerate(self.key_names, 1):
             alias = self.aliases.get(name, {}).get('alias', '')
             print(f"{i}. {name} {f'({alias})' if alias else ''}")
 
@@ -285,6 +521,11 @@ class SSHKeyManager:
         if not selection:
             return
 
+        indices = self.parse_selection(selection, len(self.keys))
+        if indices is None:
+            return
+        selected = [(self.keys[i], self.key_parts[i]) for i in indices]
+
         home = os.path.expanduser("~")
         ssh_dir = os.path.join(home, ".ssh")
         auth_keys_file = os.path.join(ssh_dir, "authorized_keys")
@@ -295,34 +536,26 @@ class SSHKeyManager:
             print(f"Error creating .ssh directory: {e}")
             return
 
-        if selection.lower() == 'all':
-            selected_keys = self.keys
-        else:
-            try:
-                indices = [int(i.strip()) - 1 for i in selection.split(',')]
-                selected_keys = [self.keys[i] for i in indices if 0 <= i < len(self.keys)]
-            except ValueError:
-                print("Invalid selection")
-                return
-
-        existing_keys = set()
+        # Compare on (type, data) so a key deployed under a different comment isn't added again
+        existing_keys = frozenset()
         if os.path.exists(auth_keys_file):
             try:
                 with open(auth_keys_file, 'r') as f:
-                    existing_keys = set(line.strip() for line in f if line.strip())
+                    lines = f.read().splitlines()
+                existing_keys = frozenset(self.get_key_parts(line) for line in lines if line.strip())
             except OSError as e:
                 print(f"Error reading existing authorized_keys file: {e}")
                 return
 
-        keys_to_add = [key for key in selected_keys if key not in existing_keys]
+        keys_to_add = [key for key, parts in selected if parts not in existing_keys]
         if not keys_to_add:
             print("All selected keys are already deployed!")
             return
 
         try:
-            with open(auth_keys_file, 'a') as f:
-                for key in keys_to_add:
-                    f.write(key + '\n')
+            payload = ('\n'.join(keys_to_add) + '\n').encode()
+            with open(auth_keys_file, 'ab') as f:
+                f.write(payload)
             
             # Set proper permissions
             try:
@@ -333,14 +566,15 @@ class SSHKeyManager:
             # Verify deployment
             try:
                 with open(auth_keys_file, 'r') as f:
-                    deployed_keys = set(line.strip() for line in f if line.strip())
+                    lines = f.read().splitlines()
+                deployed_keys = set(self.get_key_parts(line) for line in lines if line.strip())
                 
                 successfully_deployed = []
                 failed_deployments = []
                 
                 for key in keys_to_add:
                     name = self.get_key_name(key)
-                    if key in deployed_keys:
+                    if self.get_key_parts(key) in deployed_keys:
                         successfully_deployed.append(name)
                     else:
                         failed_deployments.append(name)
@@ -373,8 +607,7 @@ class SSHKeyManager:
             return
 
         print("\nAvailable keys:")
-        for i, key in enumerate(self.keys, 1):
-            name = self.get_key_name(key)
+        for i, name in enumerate(self.key_names, 1):
             alias = self.aliases.get(name, '')
             print(f"{i}. {name} {f'({alias})' if alias else ''}")
 
@@ -382,7 +615,7 @@ class SSHKeyManager:
         try:
             idx = int(selection) - 1
             if 0 <= idx < len(self.keys):
-                name = self.get_key_name(self.keys[idx])
+                name = self.key_names[idx]
                 alias = input(f"Enter new alias for {name}: ").strip()
                 if alias:
                     self.aliases[name] = alias
@@ -398,8 +631,7 @@ class SSHKeyManager:
             return
 
         print("\nAvailable keys:")
-        for i, key in enumerate(self.keys, 1):
-            name = self.get_key_name(key)
+        for i, name in enumerate(self.key_names, 1):
             alias = self.aliases.get(name, {}).get('alias', '')
             print(f"{i}. {name} {f'({alias})' if alias else ''}")
 
@@ -407,49 +639,31 @@ class SSHKeyManager:
         if not selection:
             return
 
-        # Get list of keys to delete first
-        to_delete = []
+        to_delete = self.parse_selection(selection, len(self.keys))
+        if to_delete is None:
+            return
+
         if selection.lower() == 'all':
             print("\nYou are about to delete ALL keys:")
-            for key in self.keys:
-                name = self.get_key_name(key)
-                alias = self.aliases.get(name, {}).get('alias', '')
-                print(f"- {name} {f'({alias})' if alias else ''}")
-            
-            confirm = input("\nAre you sure you want to delete all keys? This cannot be undone. (yes/N): ").lower()
-            if confirm == 'yes':
-                to_delete = list(range(len(self.keys)))
-            else:
-                print("Operation cancelled.")
-                return
         else:
-            try:
-                indices = sorted([int(i.strip()) - 1 for i in selection.split(',')], reverse=True)
-                print("\nYou are about to delete these keys:")
-                for idx in indices:
-                    if 0 <= idx < len(self.keys):
-                        name = self.get_key_name(self.keys[idx])
-                        alias = self.aliases.get(name, {}).get('alias', '')
-                        print(f"- {name} {f'({alias})' if alias else ''}")
-                
-                confirm = input("\nAre you sure you want to delete these keys? This cannot be undone. (yes/N): ").lower()
-                if confirm == 'yes':
-                    to_delete = indices
-                else:
-                    print("Operation cancelled.")
-                    return
-            except ValueError:
-                print("Invalid selection")
-                return
+            print("\nYou are about to delete these keys:")
+        for idx in to_delete:
+            name = self.key_names[idx]
+            alias = self.aliases.get(name, {}).get('alias', '')
+            print(f"- {name} {f'({alias})' if alias else ''}")
+
+        scope = "all keys" if selection.lower() == 'all' else "these keys"
+        confirm = input(f"\nAre you sure you want to delete {scope}? This cannot be undone. (yes/N): ").lower()
+        if confirm != 'yes':
+            print("Operation cancelled.")
+            return
 
         # Now perform the deletion
-        deleted_keys = []
-        for idx in to_delete:
-            if 0 <= idx < len(self.keys):
-                name = self.get_key_name(self.keys[idx])
-                deleted_keys.append(name)
-                self.aliases.pop(name, None)
-                del self.keys[idx]
+        drop = set(to_delete)
+        deleted_keys = [self.key_names[idx] for idx in sorted(drop)]
+        for name in deleted_keys:
+            self.aliases.pop(name, None)
+        self.remove_keys(drop)
 
         if deleted_keys:
             self.save_keys()
@@ -468,16 +682,17 @@ class SSHKeyManager:
         if not os.path.exists(ssh_dir):
             return key_files
 
-        for file in os.listdir(ssh_dir):
-            if file.endswith(".pub"):
-                try:
-                    path = os.path.join(ssh_dir, file)
-                    with open(path, 'r') as f:
-                        content = f.read().strip()
-                        if content:
-                            key_files.append((file, path, content))
-                except:
-                    continue
+        with os.scandir(ssh_dir) as entries:
+            pub_files = [entry for entry in entries if entry.is_file() and entry.name.endswith(".pub")]
+
+        for entry in pub_files:
+            try:
+                with open(entry.path, 'r') as f:
+                    content = f.read().strip()
+                    if content:
+                        key_files.append((entry.name, entry.path, content))
+            except:
+                continue
         return sorted(key_files)
 
     def manage_system_keys(self) -> None:
@@ -488,6 +703,10 @@ class SSHKeyManager:
                 print("No SSH keys found on this system")
                 return
 
+            # List the directory once rather than checking each private key separately
+            with os.scandir(os.path.dirname(key_files[0][1])) as entries:
+                file_names = {entry.name for entry in entries}
+
             print("\nSystem SSH Keys:")
             print("-" * 60)
             for i, (filename, path, content) in enumerate(key_files, 1):
@@ -495,7 +714,7 @@ class SSHKeyManager:
                 print(f"{i}. {filename}")
                 print(f"   Name: {name}")
                 print(f"   Path: {path}")
-                if os.path.exists(path[:-4]):  # Check if private key exists (remove .pub)
+                if filename[:-4] in file_names:  # Check if private key exists (remove .pub)
                     print("   Private key: Yes")
                 print("-" * 60)
 
@@ -589,7 +808,10 @@ class SSHKeyManager:
         Returns True if public, False if private or unable to determine."""
         if not GIT_AVAILABLE:
             return False  # Assume private if git is not available
-            
+
+        if self.repo_is_public is not None:
+            return self.repo_is_public
+
         try:
             # Get the remote URL
             result = subprocess.run(
@@ -600,32 +822,39 @@ class SSHKeyManager:
             )
             remote_url = result.stdout.strip()
 
-            # Handle different git URL formats
-            if remote_url.startswith('git@github.com:'):
-                # Convert SSH URL to HTTPS
-                repo_path = remote_url.split('git@github.com:')[1].replace('.git', '')
-                api_url = f'https://api.github.com/repos/{repo_path}'
-            elif remote_url.startswith('https://github.com/'):
-                repo_path = remote_url.split('https://github.com/')[1].replace('.git', '')
-                api_url = f'https://api.github.com/repos/{repo_path}'
-            else:
+            # Handle SSH and HTTPS GitHub URL formats
+            match = GITHUB_URL_RE.match(remote_url)
+            if not match:
                 return False  # Non-GitHub repository, assume private
+            api_url = f'https://api.github.com/repos/{match.group(1)}'
 
             # Try to access the repository anonymously
-            result = subprocess.run(
-                ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", api_url],
-                capture_output=True,
-                text=True
-            )
-            
+            request = Request(api_url, method='HEAD')
+            try:
+                with urlopen(request, timeout=3) as response:
+                    status = response.status
+            except HTTPError as e:
+                status = e.code
+            except (URLError, OSError):
+                return False  # Assume private if we can't determine
+
             # If we can access it anonymously, it's public
-            return result.stdout.strip() == "200"
-            
+            self.repo_is_public = status == 200
+            return self.repo_is_public
+
         except subprocess.CalledProcessError:
             return False  # Assume private if we can't determine
 
 def main():
+    parser = argparse.ArgumentParser(description="Manage SSH public keys stored in a git repository.")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="capture system keys listed in a JSON file without prompting, then exit")
+    args = parser.parse_args()
+
     manager = SSHKeyManager()
+    if args.batch:
+        manager.capture_batch(args.batch)
+        return
     
     while True:
         print("\nSSH Public Key Manager")
@@ -639,10 +868,7 @@ def main():
         print("5. Delete keys")
         print("6. List all keys")
         print("7. Search keys")
-        if CLIPBOARD_AVAILABLE:
-            print("8. Copy key to clipboard")
-        else:
-            print("8. Copy key to clipboard (Requires tkinter installation)")
+        print("8. Copy key to clipboard")
         print("9. Set key expiry")
         print("10. Manage system keys")
         print("11. Exit")
@@ -668,9 +894,6 @@ def main():
             search = input("Enter search term: ").strip()
             manager.list_keys(search)
         elif choice == '8':
-            if not CLIPBOARD_AVAILABLE:
-                print("\nError: tkinter is not installed. Please install tkinter to use clipboard functionality.")
-                continue
             manager.list_keys()
             key_num = input("\nEnter key number to copy: ").strip()
             try: